@@ -0,0 +1,317 @@
+"""
+Generates a new Python file each day with a small algorithm or utility.
+No external dependencies. Updates daily_code/README.md index.
+
+This is the single implementation shared by the two entry-point shims,
+scripts/generate_daily_code.py and
+.github/workflows/scripts/generate_daily_code.py.
+"""
+
+from __future__ import annotations
+import hashlib
+import os
+import random
+from datetime import datetime
+from pathlib import Path
+import string
+import textwrap
+import re
+
+# Plain parent traversal; resolve() would lstat every path component to
+# chase symlinks, which a normal checkout doesn't have.
+ROOT = Path(__file__).parent.parent
+OUT_DIR = ROOT / "daily_code"
+
+_SLUG_RE = re.compile(r"[^a-z0-9_]+")
+
+def today_seed(now: datetime) -> int:
+    return int(now.strftime("%Y%m%d"))
+
+def slugify(name: str) -> str:
+    return _SLUG_RE.sub("_", name.lower())
+
+_CODECRAFT = "codecraft"
+_WORKFLOWS = "workflows"
+
+def _grid_params(r: random.Random) -> dict:
+    # A single randbytes call produces every cell's entropy at C speed;
+    # one comprehension maps the bytes onto weights 1..9 and row slices
+    # reshape the flat buffer.
+    R, C = r.randint(4, 6), r.randint(4, 6)
+    flat = [b % 9 + 1 for b in r.randbytes(R * C)]
+    return {"GRID": [flat[i * C:(i + 1) * C] for i in range(R)]}
+
+_TEMPLATES = (
+    {
+        "name": "fibonacci_iterative",
+        "desc": "Compute the first N Fibonacci numbers iteratively.",
+        "code": """
+            def fibonacci(n: int) -> list[int]:
+                \"\"\"Return the first n Fibonacci numbers (n>=1).\"\"\"
+                if n <= 0:
+                    return []
+                if n == 1:
+                    return [0]
+                # Preallocate the result so the loop index-assigns into a
+                # fixed-size list instead of growing it append by append.
+                seq = [0] * n
+                seq[1] = 1
+                for i in range(2, n):
+                    seq[i] = seq[i - 1] + seq[i - 2]
+                return seq
+            if __name__ == "__main__":
+                N = {N}
+                print(f"Fibonacci first {N}: ", fibonacci(N))
+        """,
+        "params": lambda r: {"N": r.randint(8, 20)},
+    },
+    {
+        "name": "sieve_of_eratosthenes",
+        "desc": "Generate primes up to a limit using the Sieve of Eratosthenes.",
+        "code": """
+            def primes_up_to(limit: int) -> list[int]:
+                \"\"\"Return all primes <= limit using the sieve.\"\"\"
+                if limit < 2:
+                    return []
+                sieve = bytearray(b"\\x01") * (limit + 1)
+                sieve[0] = sieve[1] = 0
+                for p in range(2, int(limit ** 0.5) + 1):
+                    if sieve[p]:
+                        # One C-level strided fill per prime instead of a
+                        # Python loop over every composite.
+                        sieve[p * p :: p] = bytes(len(range(p * p, limit + 1, p)))
+                return [i for i, is_prime in enumerate(sieve) if is_prime]
+            if __name__ == "__main__":
+                LIMIT = {LIMIT}
+                print(f"Primes up to {LIMIT}: ", primes_up_to(LIMIT))
+        """,
+        "params": lambda r: {"LIMIT": r.randint(50, 200)},
+    },
+    {
+        "name": "merge_sort",
+        "desc": "Stable merge sort implementation with type hints.",
+        "code": """
+            from typing import List, TypeVar
+            T = TypeVar('T')
+
+            def merge_sort(arr: List[T]) -> List[T]:
+                if len(arr) <= 1:
+                    return arr[:]
+                mid = len(arr) // 2
+                left = merge_sort(arr[:mid])
+                right = merge_sort(arr[mid:])
+                return merge(left, right)
+
+            def merge(left: List[T], right: List[T]) -> List[T]:
+                i = j = 0
+                out: List[T] = []
+                while i < len(left) and j < len(right):
+                    if left[i] <= right[j]:
+                        out.append(left[i]); i += 1
+                    else:
+                        out.append(right[j]); j += 1
+                out.extend(left[i:]); out.extend(right[j:])
+                return out
+
+            if __name__ == "__main__":
+                data = {DATA}
+                print("Input:", data)
+                print("Sorted:", merge_sort(data))
+                # sorted() is the C-implemented (Timsort) reference.
+                assert merge_sort(data) == sorted(data)
+        """,
+        "params": lambda r: {"DATA": sorted(r.sample(range(-50, 51), k=r.randint(8, 14)))},
+    },
+    {
+        "name": "levenshtein_distance",
+        "desc": "Compute Levenshtein (edit) distance between two strings.",
+        "code": """
+            def levenshtein(a: str, b: str) -> int:
+                \"\"\"Return edit distance between a and b.\"\"\"
+                if a == b:
+                    return 0
+                if not a:
+                    return len(b)
+                if not b:
+                    return len(a)
+                # Two preallocated rows, swapped each iteration; the cell to
+                # the left is carried in a local instead of re-indexed.
+                prev = list(range(len(b) + 1))
+                curr = [0] * (len(b) + 1)
+                for i, ca in enumerate(a, 1):
+                    left = curr[0] = i
+                    for j, cb in enumerate(b, 1):
+                        left = curr[j] = min(left + 1, prev[j] + 1, prev[j-1] + (ca != cb))
+                    prev, curr = curr, prev
+                return prev[-1]
+
+            if __name__ == "__main__":
+                A = "{A}"
+                B = "{B}"
+                print(f"levenshtein('{A}','{B}') =", levenshtein(A, B))
+        """,
+        "params": lambda r: {"A": "".join(r.choices(_CODECRAFT, k=r.randint(4, 7))),
+                            "B": "".join(r.choices(_WORKFLOWS, k=r.randint(4, 7)))},
+    },
+    {
+        "name": "dijkstra_on_grid",
+        "desc": "Dijkstra shortest path on a small weighted grid (no deps).",
+        "code": """
+            import heapq
+            import sys
+            from array import array
+            from typing import Tuple, List
+
+            INF = sys.maxsize
+
+            def neighbors(i: int, R: int, C: int):
+                r, c = divmod(i, C)
+                if r > 0: yield i - C
+                if r < R - 1: yield i + C
+                if c > 0: yield i - 1
+                if c < C - 1: yield i + 1
+
+            def dijkstra(grid: List[List[int]], start=(0,0), goal=None) -> int:
+                R, C = len(grid), len(grid[0])
+                if goal is None: goal = (R-1, C-1)
+                # Flat row-major buffers (index r*C + c): one contiguous
+                # allocation each, int-only comparisons, no per-row pointers.
+                w = array('q', [v for row in grid for v in row])
+                dist = array('q', [INF]) * (R * C)
+                s = start[0] * C + start[1]
+                g = goal[0] * C + goal[1]
+                dist[s] = w[s]
+                pq: List[Tuple[int,int]] = [(w[s], s)]
+                while pq:
+                    d, i = heapq.heappop(pq)
+                    if i == g:
+                        return d
+                    if d != dist[i]:
+                        continue
+                    for j in neighbors(i, R, C):
+                        nd = d + w[j]
+                        if nd < dist[j]:
+                            dist[j] = nd
+                            heapq.heappush(pq, (nd, j))
+                return -1
+
+            if __name__ == "__main__":
+                grid = {GRID}
+                print("Grid:")
+                for row in grid: print(row)
+                print("Min path cost:", dijkstra(grid))
+        """,
+        "params": _grid_params,
+    },
+)
+
+# Dedent/strip each template once at import, then parse its placeholders
+# into (literal, field, spec) segments so rendering is a join over
+# precomputed pieces with no per-run textwrap or format-string parsing.
+for _t in _TEMPLATES:
+    _t["code"] = textwrap.dedent(_t["code"]).lstrip("\n")
+    _t["segments"] = tuple(string.Formatter().parse(_t["code"]))
+del _t
+
+def render_template(t, params: dict) -> str:
+    parts = []
+    for literal, field, spec, _conv in t["segments"]:
+        parts.append(literal)
+        if field is not None:
+            parts.append(format(params[field], spec or ""))
+    return "".join(parts)
+
+def pick_template(rng: random.Random):
+    return rng.choice(_TEMPLATES)
+
+def sub_rng(date_str: str, name: str) -> random.Random:
+    """Independent, reproducible RNG stream for one template on one day.
+
+    Seeding from a hash of date and template name decouples each
+    template's param draws from the master picking RNG, so a backfill
+    can render many days/templates in parallel with no shared state.
+    """
+    digest = hashlib.blake2b(f"{date_str}:{name}".encode(), digest_size=8).digest()
+    return random.Random(int.from_bytes(digest, "big"))
+
+_INDEX_HEADER = b"# Daily Python Code\n\nAuto-generated snippets, one per day.\n\n"
+
+def ensure_index():
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
+    # O_EXCL folds the existence check into the create itself: the
+    # steady-state run pays one failing open instead of stat + touch +
+    # write, and the header/.gitkeep work happens only on the first run.
+    try:
+        fd = os.open(OUT_DIR / "README.md", os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return
+    try:
+        os.write(fd, _INDEX_HEADER)
+    finally:
+        os.close(fd)
+    (OUT_DIR / ".gitkeep").touch(exist_ok=True)
+
+def update_index_batch(lines: list[str]):
+    """Append many index lines in one open/write/close cycle.
+
+    A backfill over N days pays for one file open and a single 64KB
+    buffered flush instead of N open/append/close rounds.
+    """
+    index = OUT_DIR / "README.md"
+    with index.open("a", encoding="utf-8", buffering=65536) as f:
+        f.writelines(lines)
+
+def update_index(rel_path: Path, title: str, desc: str, now: datetime):
+    stamp = now.strftime("%Y-%m-%d %H:%M UTC")
+    update_index_batch([f"- {stamp}: [{title}]({rel_path.as_posix()}) — {desc}\n"])
+
+def main():
+    # One clock read per run; everything date-related derives from it.
+    now = datetime.utcnow()
+    rng = random.Random(today_seed(now))
+    ensure_index()
+
+    date_str = now.strftime("%Y-%m-%d")
+    t = pick_template(rng)
+    params = t["params"](sub_rng(date_str, t["name"]))
+
+    year_dir = OUT_DIR / now.strftime("%Y")
+    year_dir.mkdir(parents=True, exist_ok=True)
+
+    slug = slugify(t["name"])
+    out_path = year_dir / f"{date_str}_{slug}.py"
+
+    header = f'''"""
+Title: {t["name"].replace("_"," ").title()}
+Date: {date_str}
+Description: {t["desc"]}
+This file was auto-generated by scripts/generate_daily_code.py
+"""
+'''
+    body = render_template(t, params)
+    # Encode header and body separately and write the raw bytes: one
+    # encoding pass, no large intermediate str, one write syscall.
+    payload = header.encode("utf-8") + body.encode("utf-8")
+
+    # O_EXCL makes the create both the collision probe and the claim:
+    # no separate stat() per candidate, and no window in which a
+    # concurrent run could overwrite the same name.
+    counter = 2
+    while True:
+        try:
+            fd = os.open(out_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            break
+        except FileExistsError:
+            out_path = year_dir / f"{date_str}_{slug}_v{counter}.py"
+            counter += 1
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+    rel = out_path.relative_to(ROOT)
+    update_index(rel, t["name"], t["desc"], now)
+    print(f"Wrote {rel}")
+
+if __name__ == "__main__":
+    main()
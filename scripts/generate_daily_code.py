@@ -1,34 +1,12 @@
-import os
-from datetime import datetime
-import random
+#!/usr/bin/env python3
+"""Entry point shim; the generator lives in daily_code/_generator.py."""
 
-# Make sure folder exists
-os.makedirs("daily_code", exist_ok=True)
+import sys
+from pathlib import Path
 
-today = datetime.utcnow().strftime("%Y-%m-%d")
-file_path = f"daily_code/{today}.py"
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-snippets = [
-    "print('Hello from your daily Python script!')",
-    "print('Coding is fun — keep going!')",
-    "for i in range(1, 6): print(f'Square of {i} is {i*i}')",
-    "print(sum(range(1, 101)))",
-]
+from daily_code._generator import main
 
-code = random.choice(snippets)
-
-with open(file_path, "w") as f:
-    f.write(f"# Auto-generated on {today}\n")
-    f.write(code + "\n")
-
-# Update README.md log
-entry = f"- {today}: Added `{file_path}`\n"
-if os.path.exists("README.md"):
-    with open("README.md", "a") as readme:
-        readme.write(entry)
-else:
-    with open("README.md", "w") as readme:
-        readme.write("# Daily Python Code Log\n\n")
-        readme.write(entry)
-
-print(f"Generated {file_path}")
+if __name__ == "__main__":
+    main()